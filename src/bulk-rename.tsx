@@ -50,6 +50,7 @@ export default function BulkRename() {
           moveFiles: false,
           sameAsSource: true,
           renameFiles: true,
+          useFileDates: false,
         });
 
         await showToast({
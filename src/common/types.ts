@@ -3,6 +3,8 @@ export interface MediaFile {
   name: string;
   creationDate: Date;
   extension: string;
+  size: number;
+  dev: number;
 }
 
 export interface Configuration {
@@ -11,6 +13,17 @@ export interface Configuration {
   moveFiles: boolean;
   sameAsSource: boolean;
   renameFiles: boolean;
+  useFileDates: boolean;
+}
+
+export type MetadataBackend = "builtin" | "exiftool";
+
+export type ProgressCallback = (stage: string, done: number, total?: number) => void;
+
+export interface ExtensionPreferences {
+  verboseLogging?: boolean;
+  metadataBackend?: MetadataBackend;
+  concurrency?: string;
 }
 
 export interface ProjectAssignment {
@@ -10,6 +10,7 @@ interface Step1FormProps {
   submitTitle?: string;
   description?: string;
   showRenameOption?: boolean;
+  showFileDatesOption?: boolean;
 }
 
 // Extract default values to avoid duplication
@@ -19,6 +20,7 @@ const DEFAULT_CONFIG = {
   sameAsSource: true,
   moveFiles: false,
   renameFiles: true,
+  useFileDates: false,
 } as const;
 
 // Helper function to convert string to array for Form.FilePicker
@@ -35,6 +37,7 @@ export function Step1Form({
   submitTitle = "Continue",
   description = "Step 1: Configure source and destination folders",
   showRenameOption = true,
+  showFileDatesOption = false,
 }: Step1FormProps) {
   // Consolidate form state into a single object
   const [formState, setFormState] = useState({
@@ -43,6 +46,7 @@ export function Step1Form({
     sameAsSource: config.sameAsSource ?? DEFAULT_CONFIG.sameAsSource,
     moveFiles: config.moveFiles ?? DEFAULT_CONFIG.moveFiles,
     renameFiles: config.renameFiles ?? DEFAULT_CONFIG.renameFiles,
+    useFileDates: config.useFileDates ?? DEFAULT_CONFIG.useFileDates,
   });
 
   // Update destination folder when sameAsSource changes
@@ -66,6 +70,7 @@ export function Step1Form({
     moveFiles: boolean;
     sameAsSource: boolean;
     renameFiles: boolean;
+    useFileDates?: boolean;
   }) => {
     const finalConfig: Configuration = {
       sourceFolder: arrayToString(values.sourceFolder),
@@ -75,6 +80,7 @@ export function Step1Form({
       moveFiles: values.moveFiles,
       sameAsSource: values.sameAsSource,
       renameFiles: values.renameFiles,
+      useFileDates: values.useFileDates ?? DEFAULT_CONFIG.useFileDates,
     };
     onSubmit(finalConfig);
   };
@@ -89,6 +95,7 @@ export function Step1Form({
         sameAsSource: DEFAULT_CONFIG.sameAsSource,
         moveFiles: DEFAULT_CONFIG.moveFiles,
         renameFiles: DEFAULT_CONFIG.renameFiles,
+        useFileDates: DEFAULT_CONFIG.useFileDates,
       });
       await showToast({
         style: Toast.Style.Success,
@@ -160,6 +167,16 @@ export function Step1Form({
           onChange={(value) => updateFormState({ renameFiles: value })}
         />
       )}
+
+      {showFileDatesOption && (
+        <Form.Checkbox
+          id="useFileDates"
+          label="Use file dates (faster)"
+          info="Skip reading photo and video metadata and group by each file's creation date instead"
+          value={formState.useFileDates}
+          onChange={(value) => updateFormState({ useFileDates: value })}
+        />
+      )}
     </Form>
   );
 }
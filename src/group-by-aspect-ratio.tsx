@@ -12,6 +12,7 @@ export default function GroupByAspectRatio() {
     moveFiles: false,
     sameAsSource: true,
     renameFiles: false, // Always false for aspect ratio grouping
+    useFileDates: false,
   });
   const [isLoading, setIsLoading] = useState(false);
 
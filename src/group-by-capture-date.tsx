@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from "react";
 import { showToast, Toast, popToRoot, open } from "@raycast/api";
-import { Configuration, ProjectAssignment, DateExtractionResult } from "./common/types";
+import { Configuration, ProjectAssignment, DateExtractionResult, ProgressCallback } from "./common/types";
 import { MediaService } from "./services/mediaService";
 import { ConfigStorage } from "./common/ConfigStorage";
 import { Step1Form } from "./components/Step1Form";
@@ -14,10 +14,19 @@ export default function GroupByCaptureDate() {
     moveFiles: false,
     sameAsSource: true,
     renameFiles: true,
+    useFileDates: false,
   });
   const [dateExtractionResult, setDateExtractionResult] = useState<DateExtractionResult | null>(null);
   const [isLoading, setIsLoading] = useState(false);
 
+  // Show an animated toast whose message tracks the processor's progress
+  const showProgressToast = async (title: string): Promise<ProgressCallback> => {
+    const toast = await showToast({ style: Toast.Style.Animated, title });
+    return (stage, done, total) => {
+      toast.message = total ? `${stage}: ${done}/${total}` : `${stage}: ${done}`;
+    };
+  };
+
   // Load last used configuration on component mount
   useEffect(() => {
     const loadLastConfig = async () => {
@@ -37,7 +46,12 @@ export default function GroupByCaptureDate() {
   const handleStep1Submit = async (configuration: Configuration) => {
     setIsLoading(true);
     try {
-      const result = await MediaService.extractCreationDates(configuration.sourceFolder);
+      const onProgress = await showProgressToast("Extracting dates");
+      const result = await MediaService.extractCreationDates(
+        configuration.sourceFolder,
+        configuration.useFileDates,
+        onProgress,
+      );
       setDateExtractionResult(result);
       setConfig(configuration);
 
@@ -64,7 +78,13 @@ export default function GroupByCaptureDate() {
   const handleStep2Submit = async (projectAssignments: ProjectAssignment[]) => {
     setIsLoading(true);
     try {
-      const result = await MediaService.organizeFiles(config, projectAssignments);
+      const onProgress = await showProgressToast("Organizing files");
+      const result = await MediaService.organizeFiles(
+        config,
+        projectAssignments,
+        dateExtractionResult?.files,
+        onProgress,
+      );
       await showToast({
         style: Toast.Style.Success,
         title: "Files organized successfully",
@@ -113,6 +133,7 @@ export default function GroupByCaptureDate() {
         submitTitle="Extract Dates"
         description="Step 1: Configure source and destination folders"
         showRenameOption={true}
+        showFileDatesOption={true}
       />
     );
   }
@@ -5,22 +5,98 @@ import { execFile } from "child_process";
 import { promisify } from "util";
 import exifr from "exifr";
 import ffprobe from "ffprobe-static";
+import { MediaFile, MetadataBackend, ProgressCallback } from "../common/types";
 
 const execFileAsync = promisify(execFile);
 
 export interface MediaProcessorConfig {
   moveFiles: boolean;
   renameFiles: boolean;
+  useFileDates: boolean;
+  concurrency: number;
+  verbose: boolean;
+  metadataBackend: MetadataBackend;
+  onProgress?: ProgressCallback;
 }
 
+/**
+ * Cached capture date for a file: [mtimeMs, size, ISO date string, metadata backend that read it]
+ */
+export type DateCacheEntry = [number, number, string, MetadataBackend];
+
+/**
+ * Capture date cache keyed by absolute file path
+ */
+export type DateCache = Record<string, DateCacheEntry>;
+
 export class MediaProcessor {
   private config: MediaProcessorConfig;
+  private lastProgressReport = 0;
+  private lastProgressStage = "";
+
+  // Metadata reads are I/O bound; beyond this many in-flight reads we only add disk contention
+  private static readonly MAX_CONCURRENCY = 32;
+
+  // EXIF date tags (as named by exifr) in order of preference
+  private static readonly EXIF_DATE_FIELDS = [
+    "DateTimeOriginal", // When the image was taken
+    "CreateDate", // When the image was digitized (EXIF DateTimeDigitized)
+    "ModifyDate", // When the file was modified (EXIF DateTime)
+  ];
+
+  // Container tags holding a video's capture date, in order of preference
+  private static readonly VIDEO_DATE_FIELDS = ["creation_time", "date", "date_created", "date_modified"];
+
+  // Tags exiftool reads capture dates from across photos and videos, in order of preference
+  private static readonly EXIFTOOL_DATE_TAGS = ["DateTimeOriginal", "CreateDate", "MediaCreateDate"];
+
+  // Files per exiftool run, amortising its startup cost while staying well under argument length limits
+  private static readonly EXIFTOOL_BATCH_SIZE = 500;
+
+  // JPEG EXIF lives in the APP1 segment at the start of the file, so reading this many bytes is enough
+  private static readonly EXIF_HEADER_BYTES = 80000;
 
-  // File extension constants to avoid duplication
-  private static readonly JPEG_EXTENSIONS = [".jpg", ".jpeg"];
-  private static readonly RAW_EXTENSIONS = [".raf", ".gpr", ".raw", ".cr2", ".nef", ".arw"];
-  private static readonly VIDEO_EXTENSIONS = [".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".webm", ".m4v"];
-  private static readonly IMAGE_EXTENSIONS = [
+  // exifr options that parse only the date tags
+  private static readonly EXIF_OPTIONS = {
+    pick: MediaProcessor.EXIF_DATE_FIELDS,
+    reviveValues: false, // Dates are parsed by parseExifDate
+    ifd1: false, // Skip the embedded thumbnail
+    xmp: false,
+    icc: false,
+    ihdr: false,
+    iptc: false,
+    jfif: false,
+  };
+
+  // Minimum time between progress reports so the UI is not updated for every file
+  private static readonly PROGRESS_INTERVAL_MS = 100;
+
+  // Sidecar file persisted in the source folder so repeated scans skip metadata parsing
+  private static readonly DATE_CACHE_FILENAME = ".media_organiser_cache.json";
+
+  // File extension constants to avoid duplication, as sets for constant-time lookups per file
+  private static readonly JPEG_EXTENSIONS: ReadonlySet<string> = new Set([".jpg", ".jpeg"]);
+  private static readonly RAW_EXTENSIONS: ReadonlySet<string> = new Set([
+    ".raf",
+    ".gpr",
+    ".raw",
+    ".cr2",
+    ".nef",
+    ".arw",
+  ]);
+  // RAW formats exifr can parse directly; RAF is read through its embedded JPEG instead
+  private static readonly TIFF_RAW_EXTENSIONS: ReadonlySet<string> = new Set([".gpr", ".cr2", ".nef", ".arw"]);
+  private static readonly VIDEO_EXTENSIONS: ReadonlySet<string> = new Set([
+    ".mp4",
+    ".mov",
+    ".avi",
+    ".mkv",
+    ".wmv",
+    ".flv",
+    ".webm",
+    ".m4v",
+  ]);
+  private static readonly IMAGE_EXTENSIONS: ReadonlySet<string> = new Set([
     ".jpg",
     ".jpeg",
     ".dng",
@@ -38,7 +114,7 @@ export class MediaProcessor {
     ".flv",
     ".webm",
     ".m4v",
-  ];
+  ]);
 
   constructor(config: MediaProcessorConfig) {
     this.config = config;
@@ -48,6 +124,10 @@ export class MediaProcessor {
     return {
       moveFiles: false,
       renameFiles: true,
+      useFileDates: false,
+      concurrency: 16,
+      verbose: false,
+      metadataBackend: "builtin",
     };
   }
 
@@ -63,25 +143,50 @@ export class MediaProcessor {
   }
 
   /**
-   * Utility method to get date-only part of a Date object
+   * Utility method to check if a date is valid
    */
-  private getDateOnly(date: Date): Date {
-    return new Date(date.getFullYear(), date.getMonth(), date.getDate());
+  private isValidDate(date: Date): boolean {
+    return !isNaN(date.getTime());
   }
 
   /**
-   * Utility method to check if a date is valid
+   * Utility method to parse an EXIF date string as local time
    */
-  private isValidDate(date: Date): boolean {
-    return !isNaN(date.getTime());
+  private parseExifDate(value: string): Date {
+    // EXIF dates are typically in format: YYYY:MM:DD HH:MM:SS, so slice the fields directly
+    if (value.length >= 19 && value[4] === ":" && value[7] === ":" && value[10] === " ") {
+      const year = Number(value.slice(0, 4));
+      const month = Number(value.slice(5, 7)) - 1;
+      const day = Number(value.slice(8, 10));
+      const date = new Date(
+        year,
+        month,
+        day,
+        Number(value.slice(11, 13)),
+        Number(value.slice(14, 16)),
+        Number(value.slice(17, 19)),
+      );
+      // Reject out-of-range fields (e.g. the "0000:00:00 00:00:00" placeholder) that Date would roll over
+      if (
+        this.isValidDate(date) &&
+        date.getFullYear() === year &&
+        date.getMonth() === month &&
+        date.getDate() === day
+      ) {
+        return date;
+      }
+    }
+
+    // Fall back to the general-purpose parser for non-standard formats
+    const dateStr = value.replace(/:/, " ").replace(/:/, " "); // Replace first two colons with spaces
+    return new Date(dateStr);
   }
 
   /**
-   * Utility method to check if file extension matches any in the given array
+   * Utility method to get a file's creation date, falling back to modification time where unsupported
    */
-  private hasExtension(filePath: string, extensions: string[]): boolean {
-    const ext = path.extname(filePath).toLowerCase();
-    return extensions.includes(ext);
+  private getFileDate(stats: fs.Stats): Date {
+    return stats.birthtimeMs > 0 ? stats.birthtime : stats.mtime;
   }
 
   /**
@@ -102,6 +207,61 @@ export class MediaProcessor {
     console.log(message);
   }
 
+  /**
+   * Utility method for per-file logging, which is skipped unless verbose logging is enabled
+   */
+  private logDebug(message: string): void {
+    if (this.config.verbose) {
+      console.log(message);
+    }
+  }
+
+  /**
+   * Utility method to run an async function over items with a bounded number in flight, preserving order
+   */
+  private async mapWithConcurrency<T, R>(
+    items: T[],
+    fn: (item: T) => Promise<R>,
+    concurrency = this.config.concurrency,
+  ): Promise<R[]> {
+    const limit = Math.max(1, Math.min(concurrency, MediaProcessor.MAX_CONCURRENCY));
+    const results = new Array<R>(items.length);
+    let nextIndex = 0;
+
+    const worker = async () => {
+      while (nextIndex < items.length) {
+        const index = nextIndex++;
+        results[index] = await fn(items[index]);
+      }
+    };
+
+    await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+    return results;
+  }
+
+  /**
+   * Utility method to report progress to the configured callback, throttled except for the first and final update of
+   * each stage
+   */
+  private reportProgress(stage: string, done: number, total?: number): void {
+    if (!this.config.onProgress) {
+      return;
+    }
+
+    const now = Date.now();
+    if (
+      stage === this.lastProgressStage &&
+      done !== total &&
+      now - this.lastProgressReport < MediaProcessor.PROGRESS_INTERVAL_MS
+    ) {
+      return;
+    }
+
+    this.lastProgressReport = now;
+    this.lastProgressStage = stage;
+    this.config.onProgress(stage, done, total);
+  }
+
   /**
    * Expand tilde (~) in file paths to the user's home directory
    */
@@ -115,23 +275,27 @@ export class MediaProcessor {
   /**
    * Find all media files in the source directory and its subdirectories
    */
-  async findMediaFiles(sourceDir: string): Promise<Set<string>> {
-    const files = new Set<string>();
+  async findMediaFiles(sourceDir: string): Promise<string[]> {
+    const files: string[] = [];
     const expandedSourceDir = this.expandTilde(sourceDir);
 
-    const scanDirectory = async (dir: string) => {
+    // Returns the directory's media files, plus its subdirectories so the next level can be scanned in parallel
+    const scanDirectory = async (dir: string): Promise<{ files: string[]; subdirectories: string[] }> => {
+      const dirFiles: string[] = [];
+      const subdirectories: string[] = [];
+
       try {
+        // Dirent types come from the directory listing itself, so no per-entry stat is needed
         const entries = await fs.promises.readdir(dir, { withFileTypes: true });
 
         for (const entry of entries) {
-          const fullPath = path.join(dir, entry.name);
-
           if (entry.isDirectory()) {
-            await scanDirectory(fullPath);
+            subdirectories.push(path.join(dir, entry.name));
           } else if (entry.isFile()) {
-            const ext = path.extname(entry.name).toLowerCase();
-            if (MediaProcessor.IMAGE_EXTENSIONS.includes(ext)) {
-              files.add(fullPath);
+            // Check the extension on the bare name and only build paths for matching files
+            const dotIndex = entry.name.lastIndexOf(".");
+            if (dotIndex > 0 && MediaProcessor.IMAGE_EXTENSIONS.has(entry.name.slice(dotIndex).toLowerCase())) {
+              dirFiles.push(path.join(dir, entry.name));
             }
           }
         }
@@ -139,49 +303,275 @@ export class MediaProcessor {
         this.logError(`Error scanning directory ${dir}:`, error);
         throw error;
       }
+
+      return { files: dirFiles, subdirectories };
     };
 
-    await scanDirectory(expandedSourceDir);
+    // Scan one directory level at a time, with each level's directories read concurrently.
+    // Results are combined in directory order, not completion order, so numbered duplicate names stay stable.
+    let pending = [expandedSourceDir];
+    while (pending.length > 0) {
+      const results = await this.mapWithConcurrency(pending, scanDirectory);
+      pending = [];
+      for (const result of results) {
+        // Push one at a time; spreading a very large directory as call arguments overflows the stack
+        for (const file of result.files) {
+          files.push(file);
+        }
+        for (const subdirectory of result.subdirectories) {
+          pending.push(subdirectory);
+        }
+      }
+      this.reportProgress("Scanning files", files.length);
+    }
+
+    // The scan has no total up front, so report the final count as complete to bypass the throttle
+    this.reportProgress("Scanning files", files.length, files.length);
+
     return files;
   }
 
   /**
-   * Extract creation date from media file using multiple methods
+   * Load the capture date cache from the given folder, returning an empty cache if missing or unreadable
    */
-  async getMediaDate(filePath: string): Promise<Date> {
+  async loadDateCache(folder: string): Promise<DateCache> {
+    const cachePath = path.join(this.expandTilde(folder), MediaProcessor.DATE_CACHE_FILENAME);
+
     try {
-      // 1. Try EXIF data for JPEG images
-      if (this.hasExtension(filePath, MediaProcessor.JPEG_EXTENSIONS)) {
-        const exifDate = await this.getExifDate(filePath);
-        if (exifDate) {
-          this.logInfo(`EXIF date for ${path.basename(filePath)}: ${exifDate}`);
-          return exifDate;
+      const data = await fs.promises.readFile(cachePath, "utf8");
+      const cache = JSON.parse(data);
+      return cache && typeof cache === "object" && !Array.isArray(cache) ? (cache as DateCache) : {};
+    } catch {
+      return {};
+    }
+  }
+
+  /**
+   * Persist the capture date cache to the given folder
+   */
+  async saveDateCache(folder: string, cache: DateCache): Promise<void> {
+    const cachePath = path.join(this.expandTilde(folder), MediaProcessor.DATE_CACHE_FILENAME);
+
+    try {
+      await fs.promises.writeFile(cachePath, JSON.stringify(cache));
+    } catch (error) {
+      this.logError(`Warning: Could not write date cache ${cachePath}:`, error);
+    }
+  }
+
+  /**
+   * Check whether a cache entry is still valid for the file's current stats and the configured metadata backend
+   */
+  private isCacheHit(entry: DateCacheEntry | undefined, stats: fs.Stats): entry is DateCacheEntry {
+    return (
+      !!entry && entry[0] === stats.mtimeMs && entry[1] === stats.size && entry[3] === this.config.metadataBackend
+    );
+  }
+
+  /**
+   * Locate the exiftool executable, which may not be on the PATH Raycast runs commands with
+   */
+  private async findExiftool(): Promise<string | null> {
+    const searchDirs = [...(process.env.PATH ?? "").split(path.delimiter), "/opt/homebrew/bin", "/usr/local/bin"];
+
+    for (const dir of searchDirs) {
+      if (!dir) {
+        continue;
+      }
+      const candidate = path.join(dir, "exiftool");
+      try {
+        await fs.promises.access(candidate, fs.constants.X_OK);
+        return candidate;
+      } catch {
+        continue;
+      }
+    }
+
+    return null;
+  }
+
+  /**
+   * Read capture dates for a batch of files with a single exiftool run
+   */
+  private async getExiftoolDates(exiftoolPath: string, files: string[]): Promise<Map<string, Date>> {
+    const args = [
+      "-json",
+      "-fast", // Skip trailers only; -fast2 stops at QuickTime mdat, before the moov atom cameras write last
+      "-api",
+      "QuickTimeUTC=1", // Report video dates in local time, like EXIF dates
+      ...MediaProcessor.EXIFTOOL_DATE_TAGS.map((tag) => `-${tag}`),
+      ...files,
+    ];
+
+    let stdout: string;
+    try {
+      ({ stdout } = await execFileAsync(exiftoolPath, args, { maxBuffer: 64 * 1024 * 1024 }));
+    } catch (error) {
+      // exiftool exits non-zero when some files could not be read, but still prints the others
+      stdout = (error as { stdout?: string }).stdout ?? "";
+    }
+
+    const dates = new Map<string, Date>();
+    if (!stdout.trim()) {
+      return dates;
+    }
+
+    let results: Array<Record<string, unknown>>;
+    try {
+      results = JSON.parse(stdout);
+    } catch (error) {
+      // Output can be truncated if exiftool was killed, so leave this batch to the built-in readers
+      this.logError("Warning: Could not parse exiftool output:", error);
+      return dates;
+    }
+
+    for (const result of results) {
+      for (const tag of MediaProcessor.EXIFTOOL_DATE_TAGS) {
+        const value = result[tag];
+        if (typeof value === "string" && value.trim()) {
+          const parsedDate = this.parseExifDate(value);
+          if (this.isValidDate(parsedDate)) {
+            dates.set(String(result.SourceFile), parsedDate);
+            break;
+          }
         }
       }
+    }
+
+    return dates;
+  }
+
+  /**
+   * Fill the date cache for uncached files in bulk with exiftool, leaving files it cannot date to the built-in readers
+   */
+  private async prefillDateCacheWithExiftool(fileStats: Map<string, fs.Stats>, cache: DateCache): Promise<void> {
+    const exiftoolPath = await this.findExiftool();
+    if (!exiftoolPath) {
+      this.logInfo("exiftool not found, using built-in metadata readers");
+      return;
+    }
+
+    const uncachedStats = new Map<string, fs.Stats>();
+    for (const [file, stats] of fileStats) {
+      if (!this.isCacheHit(cache[file], stats)) {
+        uncachedStats.set(file, stats);
+      }
+    }
 
-      // 2. Try RAW metadata for RAW files
-      if (this.hasExtension(filePath, MediaProcessor.RAW_EXTENSIONS)) {
-        const rawDate = await this.getRawDate(filePath);
-        if (rawDate) {
-          this.logInfo(`RAW metadata date for ${path.basename(filePath)}: ${rawDate}`);
-          return rawDate;
+    const uncachedFiles = Array.from(uncachedStats.keys());
+    const batches: string[][] = [];
+    for (let i = 0; i < uncachedFiles.length; i += MediaProcessor.EXIFTOOL_BATCH_SIZE) {
+      batches.push(uncachedFiles.slice(i, i + MediaProcessor.EXIFTOOL_BATCH_SIZE));
+    }
+
+    // exiftool is CPU heavy per process, so only run a few batches side by side
+    const processCount = Math.min(os.cpus().length, 4);
+    await this.mapWithConcurrency(
+      batches,
+      async (batch) => {
+        const dates = await this.getExiftoolDates(exiftoolPath, batch);
+        for (const [file, mediaDate] of dates) {
+          const stats = uncachedStats.get(file);
+          if (stats) {
+            cache[file] = [stats.mtimeMs, stats.size, mediaDate.toISOString(), this.config.metadataBackend];
+          }
         }
+      },
+      processCount,
+    );
+  }
+
+  /**
+   * Extract creation dates for many files concurrently, skipping files that fail
+   *
+   * Each file is stat'ed once and the result is reused for the cache, the fallback date and the file size.
+   */
+  async getMediaDates(files: Iterable<string>, cache?: DateCache): Promise<MediaFile[]> {
+    const fileList = Array.from(files);
+    const startTime = Date.now();
+
+    const statResults = await this.mapWithConcurrency(fileList, async (file) => {
+      try {
+        return await fs.promises.stat(file);
+      } catch (error) {
+        this.logError(`Error getting date for ${file}:`, error);
+        return null;
+      }
+    });
+
+    const fileStats = new Map<string, fs.Stats>();
+    fileList.forEach((file, index) => {
+      const stats = statResults[index];
+      if (stats) {
+        fileStats.set(file, stats);
       }
+    });
 
-      // 3. Try video metadata for video files
-      if (this.hasExtension(filePath, MediaProcessor.VIDEO_EXTENSIONS)) {
-        const videoDate = await this.getVideoDate(filePath);
-        if (videoDate) {
-          this.logInfo(`Video metadata date for ${path.basename(filePath)}: ${videoDate}`);
-          return videoDate;
+    // Let exiftool date files in bulk so the per-file pass below only parses what it could not date
+    if (this.config.metadataBackend === "exiftool" && !this.config.useFileDates) {
+      cache = cache ?? {};
+      await this.prefillDateCacheWithExiftool(fileStats, cache);
+    }
+
+    let done = 0;
+    const mediaFiles = await this.mapWithConcurrency(Array.from(fileStats), async ([file, stats]) => {
+      try {
+        const mediaFile: MediaFile = {
+          path: file,
+          name: path.basename(file),
+          creationDate: await this.getMediaDate(file, cache, stats),
+          extension: path.extname(file),
+          size: stats.size,
+          dev: stats.dev,
+        };
+        return mediaFile;
+      } catch (error) {
+        this.logError(`Error getting date for ${file}:`, error);
+        return null;
+      } finally {
+        this.reportProgress("Reading dates", ++done, fileStats.size);
+      }
+    });
+
+    const seconds = (Date.now() - startTime) / 1000;
+    const filesPerSecond = Math.round(fileList.length / Math.max(seconds, 0.001));
+    this.logInfo(`Read dates for ${fileList.length} files in ${seconds.toFixed(1)}s (${filesPerSecond} files/s)`);
+
+    return mediaFiles.filter((mediaFile): mediaFile is MediaFile => mediaFile !== null);
+  }
+
+  /**
+   * Extract creation date from media file, using the cache when the file is unchanged
+   */
+  async getMediaDate(filePath: string, cache?: DateCache, knownStats?: fs.Stats): Promise<Date> {
+    try {
+      const stats = knownStats ?? (await fs.promises.stat(filePath));
+
+      // Fast path: trust file timestamps and skip metadata parsing entirely
+      if (this.config.useFileDates) {
+        return this.getFileDate(stats);
+      }
+
+      const cached = cache?.[filePath];
+      if (this.isCacheHit(cached, stats)) {
+        const cachedDate = new Date(cached[2]);
+        if (this.isValidDate(cachedDate)) {
+          return cachedDate;
         }
       }
 
-      // 4. Fallback to file creation date
-      const stats = await fs.promises.stat(filePath);
-      const creationDate = new Date(stats.birthtime);
-      this.logInfo(`Using file creation date for ${path.basename(filePath)}: ${creationDate}`);
-      return creationDate;
+      const mediaDate = await this.readMediaDate(filePath);
+      if (!mediaDate) {
+        // Not cached: metadata reads can fail transiently, so try them again on the next run
+        const creationDate = this.getFileDate(stats);
+        this.logDebug(`Using file creation date for ${path.basename(filePath)}: ${creationDate}`);
+        return creationDate;
+      }
+
+      if (cache) {
+        cache[filePath] = [stats.mtimeMs, stats.size, mediaDate.toISOString(), this.config.metadataBackend];
+      }
+      return mediaDate;
     } catch (error) {
       this.logError(`Warning: Could not get creation date for ${filePath}:`, error);
       return new Date();
@@ -189,135 +579,189 @@ export class MediaProcessor {
   }
 
   /**
-   * Extract date from EXIF data
+   * Read creation date from media file metadata using multiple methods, or null if no metadata date was found
    */
-  private async getExifDate(filePath: string): Promise<Date | null> {
-    try {
-      const exif = await exifr.parse(filePath, {
-        tiff: false,
-        xmp: false,
-        icc: false,
-        ihdr: false,
-        iptc: false,
-        jfif: false,
-        exif: true,
-      });
+  private async readMediaDate(filePath: string): Promise<Date | null> {
+    const ext = path.extname(filePath).toLowerCase();
 
-      if (!exif) {
-        this.logInfo(`No EXIF data found in ${path.basename(filePath)}`);
-        return null;
+    // 1. Try EXIF data for JPEG images
+    if (MediaProcessor.JPEG_EXTENSIONS.has(ext)) {
+      const exifDate = await this.getExifDate(filePath);
+      if (exifDate) {
+        this.logDebug(`EXIF date for ${path.basename(filePath)}: ${exifDate}`);
+        return exifDate;
       }
+    }
 
-      // Try different EXIF date fields in order of preference
-      const dateFields = [
-        "DateTimeOriginal", // When the image was taken
-        "DateTimeDigitized", // When the image was digitized
-        "DateTime", // When the file was modified
-      ];
-
-      for (const field of dateFields) {
-        const value = exif[field];
-        if (value && typeof value === "string" && value.trim()) {
-          try {
-            // EXIF dates are typically in format: YYYY:MM:DD HH:MM:SS
-            const dateStr = value.replace(/:/, " ").replace(/:/, " "); // Replace first two colons with spaces
-            const parsedDate = new Date(dateStr);
-            if (this.isValidDate(parsedDate)) {
-              this.logInfo(`  Using ${field} date: ${parsedDate}`);
-              return parsedDate;
-            }
-          } catch {
-            this.logInfo(`  Error parsing ${field} date`);
-            continue;
-          }
+    // 2. Try RAW metadata for RAW files
+    if (MediaProcessor.RAW_EXTENSIONS.has(ext)) {
+      let rawDate: Date | null = null;
+      if (ext === ".raf") {
+        rawDate = await this.getRafDate(filePath);
+      } else if (MediaProcessor.TIFF_RAW_EXTENSIONS.has(ext)) {
+        rawDate = await this.getExifDate(filePath, true);
+      } else {
+        this.logDebug(`No RAW metadata reader for ${path.basename(filePath)}`);
+      }
+
+      if (rawDate) {
+        this.logDebug(`RAW metadata date for ${path.basename(filePath)}: ${rawDate}`);
+        return rawDate;
+      }
+    }
+
+    // 3. Try video metadata for video files
+    if (MediaProcessor.VIDEO_EXTENSIONS.has(ext)) {
+      const videoDate = await this.getVideoDate(filePath);
+      if (videoDate) {
+        this.logDebug(`Video metadata date for ${path.basename(filePath)}: ${videoDate}`);
+        return videoDate;
+      }
+    }
+
+    return null;
+  }
+
+  /**
+   * Extract date from EXIF data in JPEG or TIFF-based RAW files, reading only the tags and bytes needed
+   */
+  private async getExifDate(filePath: string, isRaw = false): Promise<Date | null> {
+    const source = isRaw ? "RAW file " : "";
+
+    try {
+      // JPEG EXIF sits in the header, while RAW IFDs are reached by following offsets in small chunks
+      const headerOptions = isRaw
+        ? { chunked: true }
+        : { chunked: true, firstChunkSize: MediaProcessor.EXIF_HEADER_BYTES, chunkLimit: 1 };
+
+      let exif;
+      try {
+        // Read only the metadata instead of the whole image
+        exif = await exifr.parse(filePath, { ...MediaProcessor.EXIF_OPTIONS, ...headerOptions });
+      } catch (error) {
+        // RAW reads are not truncated, so there is nothing a whole-file read could recover
+        if (isRaw) {
+          throw error;
         }
+        // The truncated JPEG read can cut through the EXIF segment, so retry with the whole file
+        exif = await exifr.parse(filePath, { ...MediaProcessor.EXIF_OPTIONS, chunked: false });
       }
 
-      return null;
+      if (!exif) {
+        this.logDebug(`No EXIF data found in ${source}${path.basename(filePath)}`);
+        return null;
+      }
+
+      return this.pickExifDate(exif);
     } catch (error) {
-      this.logError(`Error reading EXIF from ${path.basename(filePath)}:`, error);
+      this.logError(`Error reading EXIF from ${source}${path.basename(filePath)}:`, error);
       return null;
     }
   }
 
   /**
-   * Extract date from RAW file metadata using exiftool
+   * Extract date from the JPEG preview embedded in a Fujifilm RAF file, which exifr cannot parse directly
    */
-  private async getRawDate(filePath: string): Promise<Date | null> {
+  private async getRafDate(filePath: string): Promise<Date | null> {
+    let fileHandle: fs.promises.FileHandle | undefined;
+
     try {
-      const exif = await exifr.parse(filePath, {
-        tiff: true, // RAW files often use TIFF/EXIF structure
-        exif: true,
-        xmp: false,
-        icc: false,
-        ihdr: false,
-        iptc: false,
-        jfif: false,
-      });
+      const handle = await fs.promises.open(filePath, "r");
+      fileHandle = handle;
 
-      if (!exif) {
-        this.logInfo(`No EXIF data found in RAW file ${path.basename(filePath)}`);
+      // The header starts with a magic string and stores the JPEG offset and length as big-endian uint32s
+      const header = Buffer.alloc(92);
+      const { bytesRead } = await handle.read(header, 0, header.length, 0);
+      if (bytesRead < header.length || header.toString("latin1", 0, 16) !== "FUJIFILMCCD-RAW ") {
+        this.logDebug(`No RAF header found in ${path.basename(filePath)}`);
         return null;
       }
+      const jpegOffset = header.readUInt32BE(84);
+      const jpegLength = header.readUInt32BE(88);
 
-      // Try different EXIF date fields in order of preference
-      const dateFields = [
-        "DateTimeOriginal", // When the image was taken
-        "DateTimeDigitized", // When the image was digitized
-        "DateTime", // When the file was modified
-      ];
-
-      for (const field of dateFields) {
-        const value = exif[field];
-        if (value && typeof value === "string" && value.trim()) {
-          try {
-            // EXIF dates are typically in format: YYYY:MM:DD HH:MM:SS
-            const dateStr = value.replace(/:/, " ").replace(/:/, " "); // Replace first two colons with spaces
-            const parsedDate = new Date(dateStr);
-            if (this.isValidDate(parsedDate)) {
-              this.logInfo(`  Using ${field} date from RAW: ${parsedDate}`);
-              return parsedDate;
-            }
-          } catch {
-            this.logInfo(`  Error parsing ${field} date in RAW`);
-            continue;
-          }
-        } else if (value instanceof Date && this.isValidDate(value)) {
-          this.logInfo(`  Using ${field} date from RAW: ${value}`);
-          return value;
+      const readJpeg = async (length: number) => {
+        const jpeg = Buffer.alloc(length);
+        const { bytesRead } = await handle.read(jpeg, 0, length, jpegOffset);
+        return jpeg.subarray(0, bytesRead);
+      };
+
+      let exif;
+      try {
+        // EXIF sits at the start of the embedded JPEG, so read only its header
+        exif = await exifr.parse(
+          await readJpeg(Math.min(jpegLength, MediaProcessor.EXIF_HEADER_BYTES)),
+          MediaProcessor.EXIF_OPTIONS,
+        );
+      } catch (error) {
+        if (jpegLength <= MediaProcessor.EXIF_HEADER_BYTES) {
+          throw error;
         }
+        // The truncated read can cut through the EXIF segment, so retry with the whole embedded JPEG
+        exif = await exifr.parse(await readJpeg(jpegLength), MediaProcessor.EXIF_OPTIONS);
       }
 
-      return null;
+      if (!exif) {
+        this.logDebug(`No EXIF data found in RAF file ${path.basename(filePath)}`);
+        return null;
+      }
+
+      return this.pickExifDate(exif);
     } catch (error) {
-      this.logError(`Error reading EXIF from RAW file ${path.basename(filePath)}:`, error);
+      this.logError(`Error reading EXIF from RAF file ${path.basename(filePath)}:`, error);
       return null;
+    } finally {
+      await fileHandle?.close();
     }
   }
 
+  /**
+   * Pick the preferred capture date out of parsed EXIF tags
+   */
+  private pickExifDate(exif: Record<string, unknown>): Date | null {
+    for (const field of MediaProcessor.EXIF_DATE_FIELDS) {
+      const value = exif[field];
+      if (value instanceof Date && this.isValidDate(value)) {
+        this.logDebug(`  Using ${field} date: ${value}`);
+        return value;
+      } else if (value && typeof value === "string" && value.trim()) {
+        try {
+          const parsedDate = this.parseExifDate(value);
+          if (this.isValidDate(parsedDate)) {
+            this.logDebug(`  Using ${field} date: ${parsedDate}`);
+            return parsedDate;
+          }
+        } catch {
+          this.logDebug(`  Error parsing ${field} date`);
+          continue;
+        }
+      }
+    }
+
+    return null;
+  }
+
   /**
    * Extract date from video metadata using ffprobe
    */
   private async getVideoDate(filePath: string): Promise<Date | null> {
     try {
+      // Request only the date tags rather than every format and stream field
       const { stdout } = await execFileAsync(ffprobe.path, [
         "-v",
         "quiet",
         "-print_format",
         "json",
-        "-show_format",
+        "-show_entries",
+        `format_tags=${MediaProcessor.VIDEO_DATE_FIELDS.join(",")}`,
         filePath,
       ]);
 
       const result = JSON.parse(stdout);
-      if (result && result.format) {
-        const format = result.format;
-
-        // Try various date fields
-        const dateFields = ["creation_time", "date", "date_created", "date_modified"];
+      if (result && result.format && result.format.tags) {
+        const tags = result.format.tags;
 
-        for (const field of dateFields) {
-          const value = format[field];
+        for (const field of MediaProcessor.VIDEO_DATE_FIELDS) {
+          const value = tags[field];
           if (value && typeof value === "string") {
             try {
               const date = new Date(value);
@@ -339,14 +783,12 @@ export class MediaProcessor {
   }
 
   /**
-   * Check if there's enough disk space to copy the file
+   * Check if there's enough disk space in the directory for the given number of bytes
    */
-  private async hasEnoughDiskSpace(src: string, dst: string): Promise<boolean> {
+  private async hasEnoughDiskSpace(directory: string, requiredBytes: number): Promise<boolean> {
     try {
-      const srcStats = await fs.promises.stat(src);
-      const dstDir = path.dirname(dst);
-      const dstStats = await fs.promises.statfs(dstDir);
-      return dstStats.bavail * dstStats.bsize > srcStats.size;
+      const dstStats = await fs.promises.statfs(directory);
+      return dstStats.bavail * dstStats.bsize > requiredBytes;
     } catch (error) {
       this.logError("Error checking disk space:", error);
       return false;
@@ -367,31 +809,56 @@ export class MediaProcessor {
     }
   }
 
+  /**
+   * Copy a file as a copy-on-write clone where the filesystem supports it (APFS, Btrfs, XFS),
+   * otherwise as a regular kernel-side copy
+   */
+  private async copyFileFast(src: string, dst: string): Promise<void> {
+    await fs.promises.copyFile(src, dst, fs.constants.COPYFILE_FICLONE);
+  }
+
   /**
    * Safely copy or move a file with proper error handling
+   *
+   * Pass skipChecks when the caller has already checked disk space and permissions for the whole batch.
    */
-  async safeCopyFile(src: string, dst: string): Promise<void> {
+  async safeCopyFile(src: string, dst: string, skipChecks = false): Promise<void> {
     try {
-      // Check available disk space
-      if (!(await this.hasEnoughDiskSpace(src, dst))) {
-        throw new Error(`Not enough disk space to copy ${src}`);
-      }
+      if (!skipChecks) {
+        // Check available disk space
+        const srcStats = await fs.promises.stat(src);
+        if (!(await this.hasEnoughDiskSpace(path.dirname(dst), srcStats.size))) {
+          throw new Error(`Not enough disk space to copy ${src}`);
+        }
 
-      // Check permissions
-      if (!(await this.canWriteToDirectory(path.dirname(dst)))) {
-        throw new Error(`Cannot write to ${path.dirname(dst)}`);
-      }
+        // Check permissions
+        if (!(await this.canWriteToDirectory(path.dirname(dst)))) {
+          throw new Error(`Cannot write to ${path.dirname(dst)}`);
+        }
 
-      // Create parent directory if it doesn't exist
-      await fs.promises.mkdir(path.dirname(dst), { recursive: true });
+        // Create parent directory if it doesn't exist
+        await fs.promises.mkdir(path.dirname(dst), { recursive: true });
+      }
 
       // Copy or move the file
       if (this.config.moveFiles) {
-        await fs.promises.rename(src, dst);
-        this.logInfo(`Moved ${src} to ${dst}`);
+        try {
+          await fs.promises.rename(src, dst);
+        } catch (error) {
+          // rename cannot cross devices, so fall back to copying and removing the source
+          if ((error as NodeJS.ErrnoException).code !== "EXDEV") {
+            throw error;
+          }
+          const srcStats = await fs.promises.stat(src);
+          await this.copyFileFast(src, dst);
+          // Keep the source timestamps as rename would; on macOS an earlier mtime also pulls the birthtime back
+          await fs.promises.utimes(dst, srcStats.atime, srcStats.mtime);
+          await fs.promises.unlink(src);
+        }
+        this.logDebug(`Moved ${src} to ${dst}`);
       } else {
-        await fs.promises.copyFile(src, dst);
-        this.logInfo(`Copied ${src} to ${dst}`);
+        await this.copyFileFast(src, dst);
+        this.logDebug(`Copied ${src} to ${dst}`);
       }
     } catch (error) {
       this.logError(`Error processing ${src}:`, error);
@@ -418,114 +885,169 @@ export class MediaProcessor {
   }
 
   /**
-   * Generate unique filename to avoid conflicts
+   * Generate unique filename to avoid conflicts with the lowercased names already taken in the folder
    */
-  private async generateUniqueFilename(folderPath: string, originalName: string, prefix: string): Promise<string> {
+  private generateUniqueFilename(takenNames: Set<string>, originalName: string, prefix: string): string {
     const ext = path.extname(originalName);
     const baseName = path.basename(originalName, ext);
 
+    // Compare lowercased names since the destination may be case-insensitive (the macOS default)
+    let filename: string;
     if (!this.config.renameFiles) {
       // Use original name with conflict resolution
-      let filename = originalName;
-      let fullPath = path.join(folderPath, filename);
+      filename = originalName;
       let counter = 1;
 
-      while (await this.fileExists(fullPath)) {
+      while (takenNames.has(filename.toLowerCase())) {
         filename = `${baseName}_${counter}${ext}`;
-        fullPath = path.join(folderPath, filename);
         counter++;
       }
+    } else {
+      // Original rename logic with prefix
+      let counter = 1;
+      filename = `${prefix}_${originalName}`;
 
-      return filename;
-    }
-
-    // Original rename logic with prefix
-    let counter = 1;
-    let filename = `${prefix}_${originalName}`;
-    let fullPath = path.join(folderPath, filename);
-
-    while (await this.fileExists(fullPath)) {
-      filename = `${prefix}_${baseName}_${counter}${ext}`;
-      fullPath = path.join(folderPath, filename);
-      counter++;
+      while (takenNames.has(filename.toLowerCase())) {
+        filename = `${prefix}_${baseName}_${counter}${ext}`;
+        counter++;
+      }
     }
 
+    takenNames.add(filename.toLowerCase());
     return filename;
   }
 
   /**
-   * Check if file exists
+   * Get the lowercased names of the entries already in a folder
    */
-  private async fileExists(filePath: string): Promise<boolean> {
-    try {
-      await fs.promises.access(filePath);
-      return true;
-    } catch {
-      return false;
-    }
+  private async getTakenNames(folderPath: string): Promise<Set<string>> {
+    const names = await fs.promises.readdir(folderPath);
+    return new Set(names.map((name) => name.toLowerCase()));
   }
 
   /**
-   * Extract unique creation dates from files
+   * Scan the source folder once and get the creation date and size of every media file in it
    */
-  async extractDates(sourceFolder: string): Promise<string[]> {
+  async collectMediaDates(sourceFolder: string): Promise<MediaFile[]> {
     const files = await this.findMediaFiles(sourceFolder);
-    const uniqueDates = new Set<string>();
 
+    // File dates come straight from stat, so the cache would be neither read nor useful
+    if (this.config.useFileDates) {
+      return this.getMediaDates(files);
+    }
+
+    const dateCache = await this.loadDateCache(sourceFolder);
+    const mediaFiles = await this.getMediaDates(files, dateCache);
+
+    // Keep only the files seen in this scan so deleted and moved files drop out of the cache
+    const prunedCache: DateCache = {};
     for (const file of files) {
-      try {
-        const mediaDate = await this.getMediaDate(file);
-        const dateOnly = this.getDateOnly(mediaDate);
-        const dateStr = this.formatDateAsString(dateOnly);
-        uniqueDates.add(dateStr);
-      } catch (error) {
-        this.logError(`Error processing file ${file}:`, error);
-        continue;
+      if (dateCache[file]) {
+        prunedCache[file] = dateCache[file];
       }
     }
 
+    await this.saveDateCache(sourceFolder, prunedCache);
+    return mediaFiles;
+  }
+
+  /**
+   * Get the sorted unique YYYYMMDD dates of the given media files
+   */
+  getUniqueDates(mediaFiles: MediaFile[]): string[] {
+    const uniqueDates = new Set<string>();
+
+    for (const mediaFile of mediaFiles) {
+      uniqueDates.add(this.formatDateAsString(mediaFile.creationDate));
+    }
+
     return Array.from(uniqueDates).sort();
   }
 
+  /**
+   * Extract unique creation dates from files
+   */
+  async extractDates(sourceFolder: string): Promise<string[]> {
+    return this.getUniqueDates(await this.collectMediaDates(sourceFolder));
+  }
+
   /**
    * Group files based on date→project mapping
+   *
+   * Pass the media files from collectMediaDates to skip scanning the source folder again.
    */
   async groupFiles(
     sourceFolder: string,
     destinationFolder: string,
     projectNames: Record<string, string>,
+    mediaFiles?: MediaFile[],
   ): Promise<void> {
-    const files = await this.findMediaFiles(sourceFolder);
-    const fileDateMapping = new Map<string, Date>();
     const expandedDestinationFolder = this.expandTilde(destinationFolder);
 
-    // Get dates for all files
-    for (const file of files) {
-      try {
-        const mediaDate = await this.getMediaDate(file);
-        fileDateMapping.set(file, mediaDate);
-      } catch (error) {
-        this.logError(`Error getting date for ${file}:`, error);
-        continue;
-      }
+    // Get dates for all files, reusing dates cached by extractDates
+    if (!mediaFiles) {
+      mediaFiles = await this.collectMediaDates(sourceFolder);
     }
 
-    // Process each file
-    for (const [file, mediaDate] of fileDateMapping) {
-      const dateOnly = this.getDateOnly(mediaDate);
-      const dateStr = this.formatDateAsString(dateOnly);
+    // Pick out the files that have a project before touching the destination
+    const mappedFiles: Array<[MediaFile, string]> = [];
+    for (const mediaFile of mediaFiles) {
+      const dateStr = this.formatDateAsString(mediaFile.creationDate);
 
-      const projectName = projectNames[dateStr];
-      if (!projectName) {
+      if (!projectNames[dateStr]) {
         continue; // skip files with no mapping
       }
 
-      const dateFolder = await this.createDateFolder(expandedDestinationFolder, mediaDate, projectName);
-      const originalName = path.basename(file);
-      const uniqueFilename = await this.generateUniqueFilename(dateFolder, originalName, path.basename(dateFolder));
-      const destFile = path.join(dateFolder, uniqueFilename);
+      mappedFiles.push([mediaFile, dateStr]);
+    }
+
+    // Check disk space once for the whole batch instead of once per file
+    if (mappedFiles.length > 0) {
+      await fs.promises.mkdir(expandedDestinationFolder, { recursive: true });
+      const destinationDev = (await fs.promises.stat(expandedDestinationFolder)).dev;
+
+      // Sizes and devices were recorded when the files were stat'ed for their dates. Moves on the same device are
+      // renames and need no space, but moves from another device are copied before the source is removed.
+      let requiredBytes = 0;
+      for (const [mediaFile] of mappedFiles) {
+        if (!this.config.moveFiles || mediaFile.dev !== destinationDev) {
+          requiredBytes += mediaFile.size;
+        }
+      }
+
+      if (!(await this.hasEnoughDiskSpace(expandedDestinationFolder, requiredBytes))) {
+        throw new Error(`Not enough disk space in ${expandedDestinationFolder}`);
+      }
+    }
+
+    // Process each file, creating, write-checking and listing each date folder only once
+    const dateFolders = new Map<string, { folderPath: string; folderName: string; takenNames: Set<string> }>();
+    const copyStage = this.config.moveFiles ? "Moving files" : "Copying files";
+    let done = 0;
+    for (const [mediaFile, dateStr] of mappedFiles) {
+      let dateFolder = dateFolders.get(dateStr);
+      if (!dateFolder) {
+        const folderPath = await this.createDateFolder(
+          expandedDestinationFolder,
+          mediaFile.creationDate,
+          projectNames[dateStr],
+        );
+        if (!(await this.canWriteToDirectory(folderPath))) {
+          throw new Error(`Cannot write to ${folderPath}`);
+        }
+        dateFolder = {
+          folderPath,
+          folderName: path.basename(folderPath),
+          takenNames: await this.getTakenNames(folderPath),
+        };
+        dateFolders.set(dateStr, dateFolder);
+      }
+
+      const uniqueFilename = this.generateUniqueFilename(dateFolder.takenNames, mediaFile.name, dateFolder.folderName);
+      const destFile = path.join(dateFolder.folderPath, uniqueFilename);
 
-      await this.safeCopyFile(file, destFile);
+      await this.safeCopyFile(mediaFile.path, destFile, true);
+      this.reportProgress(copyStage, ++done, mappedFiles.length);
     }
 
     this.logInfo("Processing completed");
@@ -1,14 +1,49 @@
-import { DateExtractionResult, Configuration, ProjectAssignment, OrganizationResult } from "../common/types";
-import { MediaProcessor } from "./mediaProcessor";
+import { getPreferenceValues } from "@raycast/api";
+import {
+  DateExtractionResult,
+  Configuration,
+  ProjectAssignment,
+  OrganizationResult,
+  ExtensionPreferences,
+  MediaFile,
+  ProgressCallback,
+} from "../common/types";
+import { MediaProcessor, MediaProcessorConfig } from "./mediaProcessor";
 
 export class MediaService {
+  /**
+   * Build the processor configuration from the defaults and the extension preferences
+   */
+  private static getProcessorConfig(): MediaProcessorConfig {
+    const preferences = getPreferenceValues<ExtensionPreferences>();
+    const processorConfig = MediaProcessor.getDefaultConfig();
+    processorConfig.verbose = preferences.verboseLogging ?? false;
+    processorConfig.metadataBackend = preferences.metadataBackend ?? "builtin";
+
+    const concurrency = parseInt(preferences.concurrency ?? "", 10);
+    if (concurrency > 0) {
+      processorConfig.concurrency = concurrency;
+    }
+
+    return processorConfig;
+  }
+
   /**
    * Extract creation dates from media files using the TypeScript implementation
    */
-  static async extractCreationDates(sourceFolder: string): Promise<DateExtractionResult> {
+  static async extractCreationDates(
+    sourceFolder: string,
+    useFileDates = false,
+    onProgress?: ProgressCallback,
+  ): Promise<DateExtractionResult> {
     try {
-      const processor = new MediaProcessor(MediaProcessor.getDefaultConfig());
-      const dateStrings = await processor.extractDates(sourceFolder);
+      const processorConfig = this.getProcessorConfig();
+      processorConfig.useFileDates = useFileDates;
+      processorConfig.onProgress = onProgress;
+
+      const processor = new MediaProcessor(processorConfig);
+      const files = await processor.collectMediaDates(sourceFolder);
+      const dateStrings = processor.getUniqueDates(files);
 
       // Convert date strings to Date objects
       const dates = dateStrings.map((dateStr) => {
@@ -18,9 +53,8 @@ export class MediaService {
         return new Date(year, month, day);
       });
 
-      // For now, return empty files array since we're not tracking individual files
-      // This could be enhanced to return actual file information if needed
-      return { dates, files: [] };
+      // Return the per-file dates too so organizing can reuse them instead of scanning again
+      return { dates, files };
     } catch (error) {
       if (error instanceof Error) {
         throw error;
@@ -31,10 +65,14 @@ export class MediaService {
 
   /**
    * Organize files based on project assignments using the TypeScript implementation
+   *
+   * Pass the files from extractCreationDates to skip scanning the source folder and reading dates again.
    */
   static async organizeFiles(
     config: Configuration,
     projectAssignments: ProjectAssignment[],
+    files?: MediaFile[],
+    onProgress?: ProgressCallback,
   ): Promise<OrganizationResult> {
     try {
       // Prepare mapping: { YYYYMMDD: projectName }
@@ -48,12 +86,14 @@ export class MediaService {
         mapping[key] = assignment.projectName;
       }
 
-      const processorConfig = MediaProcessor.getDefaultConfig();
+      const processorConfig = this.getProcessorConfig();
       processorConfig.moveFiles = config.moveFiles;
       processorConfig.renameFiles = config.renameFiles;
+      processorConfig.useFileDates = config.useFileDates;
+      processorConfig.onProgress = onProgress;
 
       const processor = new MediaProcessor(processorConfig);
-      await processor.groupFiles(config.sourceFolder, config.destinationFolder, mapping);
+      await processor.groupFiles(config.sourceFolder, config.destinationFolder, mapping, files);
 
       return {
         success: true,